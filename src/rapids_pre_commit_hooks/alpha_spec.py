@@ -43,13 +43,17 @@ def node_has_type(node: "yaml.Node", tag_type: str) -> bool:
     return node.tag == f"tag:yaml.org,2002:{tag_type}"
 
 
+@cache
+def get_current_rapids_version(directory: str) -> "RAPIDSVersion":
+    return all_metadata().get_current_version(directory)
+
+
 def get_rapids_version(args: argparse.Namespace) -> "RAPIDSVersion":
-    md = all_metadata()
-    return (
-        md.versions[args.rapids_version]
-        if args.rapids_version
-        else md.get_current_version(os.getcwd())
-    )
+    if args.rapids_version:
+        return all_metadata().versions[args.rapids_version]
+    # Every package spec in every file asks for the version, and the VERSION
+    # file does not change during a run, so only look it up once.
+    return get_current_rapids_version(os.getcwd())
 
 
 def strip_cuda_suffix(args: argparse.Namespace, name: str) -> str:
@@ -351,6 +355,7 @@ def main() -> None:
         "VERSION file",
     )
     with m.execute() as ctx:
+        ctx.add_before_fork_hook(all_metadata)
         ctx.add_check(check_alpha_spec)
 
 
@@ -14,7 +14,7 @@
 
 import argparse
 import datetime
-import functools
+import hashlib
 import os
 import re
 import warnings
@@ -47,21 +47,28 @@ class ConflictingFilesWarning(RuntimeWarning):
 
 
 def match_copyright(content: str) -> list[re.Match]:
+    # Every notice contains this literal, and a substring search is much
+    # cheaper than running the regex over a file that has no notice at all.
+    if "Copyright" not in content:
+        return []
     return list(COPYRIGHT_RE.finditer(content))
 
 
-def strip_copyright(
-    content: str, copyright_matches: list[re.Match]
-) -> list[str]:
-    lines = []
+def strip_copyright(content: str, copyright_matches: list[re.Match]) -> str:
+    segments = []
+    start = 0
+    for match in copyright_matches:
+        segments.append(content[start : match.start()])
+        start = match.end()
+    segments.append(content[start:])
+    return "".join(segments)
 
-    def append_stripped(start: int, item: re.Match):
-        lines.append(content[start : item.start()])
-        return item.end()
 
-    start = functools.reduce(append_stripped, copyright_matches, 0)
-    lines.append(content[start:])
-    return lines
+def git_blob_sha(content: str) -> bytes:
+    data = content.encode()
+    sha = hashlib.sha1(f"blob {len(data)}\0".encode())
+    sha.update(data)
+    return sha.digest()
 
 
 def add_copy_rename_note(
@@ -125,21 +132,23 @@ def apply_copyright_update(
     )
 
 
+def get_current_year() -> int:
+    if year_env := os.getenv("RAPIDS_TEST_YEAR"):
+        try:
+            return int(year_env)
+        except ValueError:
+            pass
+    return datetime.datetime.now().year
+
+
 def apply_copyright_check(
     linter: Linter,
     change_type: str,
     old_filename: str | os.PathLike[str] | None,
     old_content: str | None,
+    current_year: int,
 ) -> None:
     if linter.content != old_content:
-        year_env = os.getenv("RAPIDS_TEST_YEAR")
-        if year_env:
-            try:
-                current_year = int(year_env)
-            except ValueError:
-                current_year = datetime.datetime.now().year
-        else:
-            current_year = datetime.datetime.now().year
         new_copyright_matches = match_copyright(linter.content)
 
         if old_content is not None:
@@ -306,43 +315,52 @@ def get_changed_files(
     try:
         repo = git.Repo()
     except git.InvalidGitRepositoryError:
+        # Without history, every file is new. Only the files being linted can
+        # be looked up, so there is no need to walk the whole tree.
         return {
-            os.path.relpath(os.path.join(dirpath, filename), "."): ("A", None)
-            for dirpath, dirnames, filenames in os.walk(".")
-            for filename in filenames
+            git_filename: ("A", None)
+            for filename in args.files
+            if (git_filename := normalize_git_filename(filename))
         }
 
-    changed_files: dict[
-        str | os.PathLike[str], tuple[str, Optional["git.Blob"]]
-    ] = {f: ("A", None) for f in repo.untracked_files}
-    target_branch_upstream_commit = get_target_branch_upstream_commit(
-        repo, args
-    )
-    if target_branch_upstream_commit is None:
-        changed_files.update(
-            {blob.path: ("A", None) for _, blob in repo.index.iter_blobs()}
+    # Closing the repository stops GitPython's persistent git cat-file
+    # processes. Blob reads restart them in whichever process needs them,
+    # so forked --jobs workers do not share the parent's pipes.
+    with repo:
+        changed_files: dict[
+            str | os.PathLike[str], tuple[str, Optional["git.Blob"]]
+        ] = {f: ("A", None) for f in repo.untracked_files}
+        target_branch_upstream_commit = get_target_branch_upstream_commit(
+            repo, args
         )
-        return changed_files
-
-    for merge_base in repo.merge_base(
-        repo.head.commit, target_branch_upstream_commit, all=True
-    ):
-        diffs = merge_base.diff(
-            other=None,
-            find_copies=True,
-            find_copies_harder=True,
-            find_renames=True,
-        )
-        for diff in diffs:
-            if diff.change_type == "A":
-                assert diff.b_path is not None
-                changed_files[diff.b_path] = (diff.change_type, None)
-            elif diff.change_type != "D":
-                assert diff.b_path is not None
-                assert diff.change_type is not None
-                changed_files[diff.b_path] = (diff.change_type, diff.a_blob)
+        if target_branch_upstream_commit is None:
+            changed_files.update(
+                {blob.path: ("A", None) for _, blob in repo.index.iter_blobs()}
+            )
+            return changed_files
+
+        for merge_base in repo.merge_base(
+            repo.head.commit, target_branch_upstream_commit, all=True
+        ):
+            diffs = merge_base.diff(
+                other=None,
+                find_copies=True,
+                find_copies_harder=args.find_copies_harder,
+                find_renames=True,
+            )
+            for diff in diffs:
+                if diff.change_type == "A":
+                    assert diff.b_path is not None
+                    changed_files[diff.b_path] = (diff.change_type, None)
+                elif diff.change_type != "D":
+                    assert diff.b_path is not None
+                    assert diff.change_type is not None
+                    changed_files[diff.b_path] = (
+                        diff.change_type,
+                        diff.a_blob,
+                    )
 
-    return changed_files
+        return changed_files
 
 
 def normalize_git_filename(filename: str | os.PathLike[str]) -> str | None:
@@ -355,29 +373,18 @@ def normalize_git_filename(filename: str | os.PathLike[str]) -> str | None:
 def find_blob(
     tree: "git.Tree", filename: str | os.PathLike[str]
 ) -> Optional["git.Blob"]:
-    d1, d2 = os.path.split(filename)
-    split = [d2]
-    while d1:
-        d1, d2 = os.path.split(d1)
-        split.insert(0, d2)
-
-    while len(split) > 1:
-        component = split.pop(0)
-        try:
-            tree = next(t for t in tree.trees if t.name == component)
-        except StopIteration:
-            return None
-
     try:
-        return next(blob for blob in tree.blobs if blob.name == split[0])
-    except StopIteration:
+        blob = tree / os.fspath(filename)
+    except KeyError:
         return None
+    return blob if isinstance(blob, git.Blob) else None
 
 
 def check_copyright(
     args: argparse.Namespace,
 ) -> Callable[[Linter, argparse.Namespace], None]:
     changed_files = get_changed_files(args)
+    current_year = get_current_year()
 
     def the_check(linter: Linter, _args: argparse.Namespace):
         if not (git_filename := normalize_git_filename(linter.filename)):
@@ -397,9 +404,15 @@ def check_copyright(
             old_filename = None
             old_content = None
         else:
+            # If the file is identical to the old blob after decoding, there
+            # is nothing to check, so skip reading and decoding the blob.
+            if changed_file.binsha == git_blob_sha(linter.content):
+                return
             old_filename = changed_file.path
             old_content = changed_file.data_stream.read().decode()
-        apply_copyright_check(linter, change_type, old_filename, old_content)
+        apply_copyright_check(
+            linter, change_type, old_filename, old_content, current_year
+        )
 
     return the_check
 
@@ -426,6 +439,13 @@ def main() -> None:
         metavar="<target branch>",
         help="target branch to check modified files against",
     )
+    m.argparser.add_argument(
+        "--find-copies-harder",
+        help="also detect files copied from unmodified files (can be slow "
+        "in large repositories)",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+    )
     with m.execute() as ctx:
         ctx.add_check(check_copyright(ctx.args))
 
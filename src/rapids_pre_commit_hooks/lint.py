@@ -16,10 +16,12 @@ import argparse
 import bisect
 import contextlib
 import dataclasses
-import functools
+import multiprocessing
+import os
 import re
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from itertools import pairwise
 
 from rich.console import Console
@@ -36,19 +38,19 @@ class BinaryFileWarning(Warning):
     pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Replacement:
     pos: _PosType
     newtext: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Note:
     pos: _PosType
     msg: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class LintWarning:
     pos: _PosType
     msg: str
@@ -66,6 +68,7 @@ class LintWarning:
 
 class Linter:
     NEWLINE_RE: re.Pattern = re.compile("[\r\n]")
+    LINE_SEPARATOR_RE: re.Pattern = re.compile("\r\n?|\n")
 
     def __init__(self, filename: str, content: str) -> None:
         self.filename: str = filename
@@ -94,14 +97,14 @@ class Linter:
                 raise OverlappingReplacementsError(f"{r1} overlaps with {r2}")
 
         cursor = 0
-        replaced_content = ""
+        segments = []
         for replacement in sorted_replacements:
-            replaced_content += self.content[cursor : replacement.pos[0]]
-            replaced_content += replacement.newtext
+            segments.append(self.content[cursor : replacement.pos[0]])
+            segments.append(replacement.newtext)
             cursor = replacement.pos[1]
 
-        replaced_content += self.content[cursor:]
-        return replaced_content
+        segments.append(self.content[cursor:])
+        return "".join(segments)
 
     def _print_note(
         self,
@@ -174,45 +177,23 @@ class Linter:
         else:
             right = line_pos[1]
 
+        before = escape(self.content[line_pos[0] : left])
+        highlighted = escape(self.content[left:right])
+        after = escape(self.content[right : line_pos[1]])
+
         if replacement is None:
-            self.console.print(
-                f" {escape(self.content[line_pos[0] : left])}"
-                f"[bold]{escape(self.content[left:right])}[/bold]"
-                f"{escape(self.content[right : line_pos[1]])}"
-            )
+            self.console.print(f" {before}[bold]{highlighted}[/bold]{after}")
         else:
             self.console.print(
-                f"[red]-{escape(self.content[line_pos[0] : left])}"
-                f"[bold]{escape(self.content[left:right])}[/bold]"
-                f"{escape(self.content[right : line_pos[1]])}[/red]"
+                f"[red]-{before}[bold]{highlighted}[/bold]{after}[/red]"
             )
             self.console.print(
-                f"[green]+{escape(self.content[line_pos[0] : left])}"
-                f"[bold]{escape(replacement)}[/bold]"
-                f"{escape(self.content[right : line_pos[1]])}[/green]"
+                f"[green]+{before}[bold]{escape(replacement)}[/bold]"
+                f"{after}[/green]"
             )
 
     def _line_for_pos(self, index: int) -> int:
-        @functools.total_ordering
-        class LineComparator:
-            def __init__(self, pos: _PosType) -> None:
-                self.pos: _PosType = pos
-
-            def __lt__(self, other: object) -> bool:
-                assert isinstance(other, int)
-                return self.pos[1] < other
-
-            def __gt__(self, other: object) -> bool:
-                assert isinstance(other, int)
-                return self.pos[0] > other
-
-            def __eq__(self, other: object) -> bool:
-                assert isinstance(other, int)
-                return self.pos[0] <= other <= self.pos[1]
-
-        line_index = bisect.bisect_left(
-            [LineComparator(line) for line in self.lines], index
-        )
+        line_index = bisect.bisect_left(self._line_ends, index)
         try:
             line_pos = self.lines[line_index]
         except IndexError:
@@ -225,50 +206,76 @@ class Linter:
         self.lines: list[_PosType] = []
 
         line_begin = 0
-        line_end = 0
-        state = "c"
-
-        for c in self.content:
-            if state == "c":
-                if c == "\r":
-                    self.lines.append((line_begin, line_end))
-                    line_end = line_begin = line_end + 1
-                    state = "r"
-                elif c == "\n":
-                    self.lines.append((line_begin, line_end))
-                    line_end = line_begin = line_end + 1
-                else:
-                    line_end += 1
-            elif state == "r":
-                if c == "\r":
-                    self.lines.append((line_begin, line_end))
-                    line_end = line_begin = line_end + 1
-                elif c == "\n":
-                    line_end = line_begin = line_end + 1
-                    state = "c"
-                else:
-                    line_end += 1
-                    state = "c"
+        for match in self.LINE_SEPARATOR_RE.finditer(self.content):
+            self.lines.append((line_begin, match.start()))
+            line_begin = match.end()
 
-        self.lines.append((line_begin, line_end))
+        self.lines.append((line_begin, len(self.content)))
+        self._line_ends: list[int] = [end for _, end in self.lines]
 
 
 class ExecutionContext(contextlib.AbstractContextManager):
     def __init__(self, args: argparse.Namespace) -> None:
         self.args: argparse.Namespace = args
         self.checks: list[Callable[[Linter, argparse.Namespace], None]] = []
+        self.before_fork_hooks: list[Callable[[], None]] = []
 
     def add_check(
         self, check: Callable[[Linter, argparse.Namespace], None]
     ) -> None:
         self.checks.append(check)
 
+    def add_before_fork_hook(self, hook: Callable[[], None]) -> None:
+        self.before_fork_hooks.append(hook)
+
+    def run_checks(self, linter: Linter) -> None:
+        for check in self.checks:
+            check(linter, self.args)
+
+    def _lint_files(self, files: list[tuple[str, str]]) -> Iterator[Linter]:
+        jobs = self.args.jobs or _available_cpu_count()
+        if (
+            jobs > 1
+            and len(files) > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            # Workers are forked so that they inherit the checks, which are
+            # frequently closures and cannot be pickled. Only the file
+            # contents and the resulting warnings cross process boundaries.
+            # Before-fork hooks let checks load shared state once in the
+            # parent instead of once per worker.
+            for hook in self.before_fork_hooks:
+                hook()
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(files)),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+                initargs=(self,),
+            ) as executor:
+                for (filename, content), file_warnings in zip(
+                    files,
+                    executor.map(
+                        _run_worker_checks,
+                        *zip(*files),
+                        chunksize=max(1, len(files) // (jobs * 4)),
+                    ),
+                ):
+                    linter = Linter(filename, content)
+                    linter.warnings = file_warnings
+                    yield linter
+        else:
+            for filename, content in files:
+                linter = Linter(filename, content)
+                self.run_checks(linter)
+                yield linter
+
     def __exit__(self, exc_type, exc_value, traceback) -> None:
         if exc_type:
             return
 
         has_warnings = False
 
+        files: list[tuple[str, str]] = []
         for file in self.args.files:
             with open(file) as f:
                 try:
@@ -279,16 +286,14 @@ class ExecutionContext(contextlib.AbstractContextManager):
                         BinaryFileWarning,
                     )
                     continue
+            files.append((file, content))
 
-            linter = Linter(file, content)
-            for check in self.checks:
-                check(linter, self.args)
-
+        for linter in self._lint_files(files):
             linter.print_warnings(self.args.fix)
             if self.args.fix:
                 fix = linter.fix()
-                if fix != content:
-                    with open(file, "w") as f:
+                if fix != linter.content:
+                    with open(linter.filename, "w") as f:
                         f.write(fix)
 
             if len(linter.warnings) > 0:
@@ -298,6 +303,42 @@ class ExecutionContext(contextlib.AbstractContextManager):
             exit(1)
 
 
+def _available_cpu_count() -> int:
+    # os.cpu_count() ignores the affinity mask, which containers and CI
+    # runners often use to limit a process to fewer CPUs.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+_worker_context: ExecutionContext | None = None
+
+
+def _init_worker(context: ExecutionContext) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def _run_worker_checks(filename: str, content: str) -> list[LintWarning]:
+    assert _worker_context is not None
+    linter = Linter(filename, content)
+    _worker_context.run_checks(linter)
+    return linter.warnings
+
+
+def _jobs(value: str) -> int:
+    try:
+        jobs = int(value)
+        if jobs < 0:
+            raise ValueError
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"must be a non-negative integer: {value!r}"
+        ) from None
+    return jobs
+
+
 class LintMain:
     context_class = ExecutionContext
 
@@ -306,6 +347,15 @@ class LintMain:
         self.argparser.add_argument(
             "--fix", action="store_true", help="automatically fix warnings"
         )
+        self.argparser.add_argument(
+            "-j",
+            "--jobs",
+            type=_jobs,
+            default=1,
+            metavar="<jobs>",
+            help="number of processes to lint files with (0 for all available "
+            "CPUs)",
+        )
         self.argparser.add_argument("files", nargs="+", metavar="file")
 
     def execute(self) -> ExecutionContext:
@@ -90,6 +90,47 @@ def test_get_rapids_version(
                 assert version == MOCK_METADATA.versions[expected_version]
 
 
+@pytest.fixture
+def mock_all_metadata():
+    MOCK_METADATA = RAPIDSMetadata(
+        versions={
+            "24.06": RAPIDSVersion(
+                repositories={
+                    "repo1": RAPIDSRepository(),
+                },
+            ),
+        },
+    )
+    with patch(
+        "rapids_pre_commit_hooks.alpha_spec.all_metadata",
+        Mock(return_value=MOCK_METADATA),
+    ) as all_metadata:
+        yield all_metadata
+
+
+def test_get_rapids_version_cached(tmp_path, mock_all_metadata):
+    with open(os.path.join(tmp_path, "VERSION"), "w") as f:
+        f.write("24.06\n")
+    with set_cwd(tmp_path):
+        args = Mock(rapids_version=None)
+        version = alpha_spec.get_rapids_version(args)
+        assert version == mock_all_metadata.return_value.versions["24.06"]
+        assert alpha_spec.get_rapids_version(args) is version
+        mock_all_metadata.assert_called_once()
+
+
+def test_get_rapids_version_parent_directory(tmp_path, mock_all_metadata):
+    with open(os.path.join(tmp_path, "VERSION"), "w") as f:
+        f.write("24.06\n")
+    os.mkdir(os.path.join(tmp_path, "sub"))
+    with set_cwd(os.path.join(tmp_path, "sub")):
+        args = Mock(rapids_version=None)
+        assert (
+            alpha_spec.get_rapids_version(args)
+            == mock_all_metadata.return_value.versions["24.06"]
+        )
+
+
 def test_anchor_preserving_loader():
     loader = alpha_spec.AnchorPreservingLoader("- &a A\n- *a")
     try:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
 import datetime
 import os.path
 import tempfile
@@ -23,7 +24,13 @@ import pytest
 from freezegun import freeze_time
 
 from rapids_pre_commit_hooks import copyright
-from rapids_pre_commit_hooks.lint import Linter, LintWarning, Note, Replacement
+from rapids_pre_commit_hooks.lint import (
+    ExecutionContext,
+    Linter,
+    LintWarning,
+    Note,
+    Replacement,
+)
 
 
 def test_match_copyright():
@@ -81,15 +88,15 @@ def test_strip_copyright():
     )
     matches = copyright.match_copyright(CONTENT)
     stripped = copyright.strip_copyright(CONTENT, matches)
-    assert stripped == [
-        "\nThis is a line before the first copyright statement\n",
-        "\nThis is a line between the first two copyright statements\n",
-        "\nThis is a line between the next two copyright statements\n# ",
-        " and affiliates\nThis is a line after the last copyright statement\n",
-    ]
+    assert stripped == (
+        "\nThis is a line before the first copyright statement\n"
+        "\nThis is a line between the first two copyright statements\n"
+        "\nThis is a line between the next two copyright statements\n# "
+        " and affiliates\nThis is a line after the last copyright statement\n"
+    )
 
     stripped = copyright.strip_copyright("No copyright here", [])
-    assert stripped == ["No copyright here"]
+    assert stripped == "No copyright here"
 
 
 @pytest.mark.parametrize(
@@ -550,13 +557,12 @@ def test_strip_copyright():
         ),
     ],
 )
-@freeze_time("2024-01-18")
 def test_apply_copyright_check(
     change_type, old_filename, old_content, new_filename, new_content, warnings
 ):
     linter = Linter(new_filename, new_content)
     copyright.apply_copyright_check(
-        linter, change_type, old_filename, old_content
+        linter, change_type, old_filename, old_content, 2024
     )
     assert linter.warnings == warnings
 
@@ -934,30 +940,11 @@ def test_get_target_branch_upstream_commit(git_repo):
             )
 
 
-def test_get_changed_files(git_repo):
-    def mock_os_walk(top):
-        return patch(
-            "os.walk",
-            Mock(
-                return_value=(
-                    (
-                        (
-                            "."
-                            if (rel := os.path.relpath(dirpath, top)) == "."
-                            else os.path.join(".", rel)
-                        ),
-                        dirnames,
-                        filenames,
-                    )
-                    for dirpath, dirnames, filenames in os.walk(top)
-                )
-            ),
-        )
-
+@pytest.mark.parametrize("find_copies_harder", [True, False])
+def test_get_changed_files(git_repo, find_copies_harder):
     with (
         tempfile.TemporaryDirectory() as non_git_dir,
         patch("os.getcwd", Mock(return_value=non_git_dir)),
-        mock_os_walk(non_git_dir),
     ):
         with open(os.path.join(non_git_dir, "top.txt"), "w") as f:
             f.write("Top file\n")
@@ -967,7 +954,15 @@ def test_get_changed_files(git_repo):
             os.path.join(non_git_dir, "subdir1", "subdir2", "sub.txt"), "w"
         ) as f:
             f.write("Subdir file\n")
-        assert copyright.get_changed_files(Mock()) == {
+        assert copyright.get_changed_files(
+            Mock(
+                files=[
+                    "top.txt",
+                    "./subdir1/subdir2/sub.txt",
+                    "../outside.txt",
+                ]
+            )
+        ) == {
             "top.txt": ("A", None),
             "subdir1/subdir2/sub.txt": ("A", None),
         }
@@ -1010,7 +1005,6 @@ def test_get_changed_files(git_repo):
 
     with (
         patch("os.getcwd", Mock(return_value=git_repo.working_tree_dir)),
-        mock_os_walk(git_repo.working_tree_dir),
         patch(
             "rapids_pre_commit_hooks.copyright."
             "get_target_branch_upstream_commit",
@@ -1113,6 +1107,13 @@ def test_get_changed_files(git_repo):
         "renamed_2.txt": ("R", "renamed.txt"),
     }
 
+    if not find_copies_harder:
+        # Without --find-copies-harder, these copies are not detected and show
+        # up as new files instead
+        changed["copied_and_modified_2.txt"] = ("A", None)
+        superfluous["modified_and_copied_2.txt"] = ("A", None)
+        superfluous["copied_2.txt"] = ("A", None)
+
     with (
         patch("os.getcwd", Mock(return_value=git_repo.working_tree_dir)),
         patch(
@@ -1121,7 +1122,9 @@ def test_get_changed_files(git_repo):
             Mock(return_value=target_branch.commit),
         ),
     ):
-        changed_files = copyright.get_changed_files(Mock())
+        changed_files = copyright.get_changed_files(
+            Mock(find_copies_harder=find_copies_harder)
+        )
     assert {
         path: (change_type, old_blob.path if old_blob else None)
         for path, (change_type, old_blob) in changed_files.items()
@@ -1225,7 +1228,9 @@ def test_get_changed_files_multiple_merge_bases(git_repo):
             Mock(return_value="branch-1-2"),
         ),
     ):
-        changed_files = copyright.get_changed_files(Mock())
+        changed_files = copyright.get_changed_files(
+            Mock(find_copies_harder=True)
+        )
     assert {
         path: (change_type, old_blob.path if old_blob else None)
         for path, (change_type, old_blob) in changed_files.items()
@@ -1236,6 +1241,27 @@ def test_get_changed_files_multiple_merge_bases(git_repo):
     }
 
 
+def test_git_blob_sha():
+    assert (
+        copyright.git_blob_sha("").hex()
+        == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+    )
+    assert (
+        copyright.git_blob_sha("hello\n").hex()
+        == "ce013625030ba8dba906f756967f9e9ca394464a"
+    )
+
+
+@freeze_time("2024-01-18")
+def test_get_current_year():
+    with patch.dict("os.environ", {}, clear=True):
+        assert copyright.get_current_year() == 2024
+    with patch.dict("os.environ", {"RAPIDS_TEST_YEAR": "2023"}):
+        assert copyright.get_current_year() == 2023
+    with patch.dict("os.environ", {"RAPIDS_TEST_YEAR": "invalid"}):
+        assert copyright.get_current_year() == 2024
+
+
 def test_normalize_git_filename():
     assert copyright.normalize_git_filename("file.txt") == "file.txt"
     assert copyright.normalize_git_filename("sub/file.txt") == "sub/file.txt"
@@ -1262,6 +1288,8 @@ def test_normalize_git_filename():
         ("sub1/sub2/sub.txt", True),
         ("nonexistent.txt", False),
         ("nonexistent/sub.txt", False),
+        ("sub1", False),
+        ("top.txt/sub.txt", False),
     ],
 )
 def test_find_blob(git_repo, path, present):
@@ -1308,13 +1336,29 @@ def test_check_copyright(git_repo):
             """
         )
 
+    def file_contents_renamed(num):
+        return dedent(
+            rf"""\
+            Copyright (c) 2021-2023 NVIDIA CORPORATION
+            File {num}
+            Renamed
+            """
+        )
+
     os.mkdir(os.path.join(git_repo.working_tree_dir, "dir"))
     write_file("file1.txt", file_contents(1))
     write_file("dir/file2.txt", file_contents(2))
     write_file("file3.txt", file_contents(3))
     write_file("file4.txt", file_contents(4))
+    write_file("dir/file7.txt", file_contents(7))
     git_repo.index.add(
-        ["file1.txt", "dir/file2.txt", "file3.txt", "file4.txt"]
+        [
+            "file1.txt",
+            "dir/file2.txt",
+            "file3.txt",
+            "file4.txt",
+            "dir/file7.txt",
+        ]
     )
     git_repo.index.commit("Initial commit")
 
@@ -1343,6 +1387,10 @@ def test_check_copyright(git_repo):
     git_repo.index.commit("Update file4.txt")
     git_repo.index.move(["dir/file2.txt", "file5.txt"])
     git_repo.index.commit("Rename file2.txt to file5.txt")
+    git_repo.index.move(["dir/file7.txt", "file8.txt"])
+    write_file("file8.txt", file_contents_renamed(7))
+    git_repo.index.add(["file8.txt"])
+    git_repo.index.commit("Rename and modify file7.txt to file8.txt")
 
     write_file("file6.txt", file_contents(6))
 
@@ -1369,7 +1417,9 @@ def test_check_copyright(git_repo):
     # branch-1 is target branch
     #############################
 
-    mock_args = Mock(target_branch="branch-1", batch=False)
+    mock_args = Mock(
+        target_branch="branch-1", batch=False, find_copies_harder=True
+    )
 
     with mock_repo_cwd(), mock_target_branch_upstream_commit("branch-1"):
         copyright_checker = copyright.check_copyright(mock_args)
@@ -1380,36 +1430,45 @@ def test_check_copyright(git_repo):
         apply_copyright_check.assert_not_called()
 
     linter = Linter("file5.txt", file_contents(2))
+    with mock_apply_copyright_check() as apply_copyright_check:
+        copyright_checker(linter, mock_args)
+        apply_copyright_check.assert_not_called()
+
+    linter = Linter("file8.txt", file_contents_renamed(7))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "R", "dir/file2.txt", file_contents(2)
+            linter, "R", "dir/file7.txt", file_contents(7), 2024
         )
 
     linter = Linter("file3.txt", file_contents_modified(3))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "M", "file3.txt", file_contents(3)
+            linter, "M", "file3.txt", file_contents(3), 2024
         )
 
     linter = Linter("file4.txt", file_contents_modified(4))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "M", "file4.txt", file_contents(4)
+            linter, "M", "file4.txt", file_contents(4), 2024
         )
 
     linter = Linter("file6.txt", file_contents(6))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
-        apply_copyright_check.assert_called_once_with(linter, "A", None, None)
+        apply_copyright_check.assert_called_once_with(
+            linter, "A", None, None, 2024
+        )
 
     #############################
     # branch-2 is target branch
     #############################
 
-    mock_args = Mock(target_branch="branch-2", batch=False)
+    mock_args = Mock(
+        target_branch="branch-2", batch=False, find_copies_harder=True
+    )
 
     with mock_repo_cwd(), mock_target_branch_upstream_commit("branch-2"):
         copyright_checker = copyright.check_copyright(mock_args)
@@ -1418,14 +1477,14 @@ def test_check_copyright(git_repo):
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "M", "file1.txt", file_contents(1)
+            linter, "M", "file1.txt", file_contents(1), 2024
         )
 
     linter = Linter("./file1.txt", file_contents_modified(1))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "M", "file1.txt", file_contents(1)
+            linter, "M", "file1.txt", file_contents(1), 2024
         )
 
     linter = Linter("../file1.txt", file_contents_modified(1))
@@ -1439,27 +1498,86 @@ def test_check_copyright(git_repo):
         apply_copyright_check.assert_not_called()
 
     linter = Linter("file5.txt", file_contents(2))
+    with mock_apply_copyright_check() as apply_copyright_check:
+        copyright_checker(linter, mock_args)
+        apply_copyright_check.assert_not_called()
+
+    linter = Linter("file8.txt", file_contents_renamed(7))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "R", "dir/file2.txt", file_contents(2)
+            linter, "R", "dir/file7.txt", file_contents(7), 2024
         )
 
     linter = Linter("file3.txt", file_contents_modified(3))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "M", "file3.txt", file_contents(3)
+            linter, "M", "file3.txt", file_contents(3), 2024
         )
 
     linter = Linter("file4.txt", file_contents_modified(4))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
         apply_copyright_check.assert_called_once_with(
-            linter, "M", "file4.txt", file_contents(4)
+            linter, "M", "file4.txt", file_contents(4), 2024
         )
 
     linter = Linter("file6.txt", file_contents(6))
     with mock_apply_copyright_check() as apply_copyright_check:
         copyright_checker(linter, mock_args)
-        apply_copyright_check.assert_called_once_with(linter, "A", None, None)
+        apply_copyright_check.assert_called_once_with(
+            linter, "A", None, None, 2024
+        )
+
+
+def test_check_copyright_jobs(git_repo):
+    def fn(filename):
+        return os.path.join(git_repo.working_tree_dir, filename)
+
+    def write_file(filename, contents):
+        with open(fn(filename), "w") as f:
+            f.write(contents)
+
+    filenames = [f"file{num}.txt" for num in range(100)]
+    for num, filename in enumerate(filenames):
+        write_file(
+            filename, f"Copyright (c) 2023 NVIDIA CORPORATION\nFile {num}\n"
+        )
+    git_repo.index.add(filenames)
+    git_repo.index.commit("Initial commit")
+
+    pr = git_repo.create_head("pr", "master")
+    git_repo.head.reference = pr
+    git_repo.head.reset(index=True, working_tree=True)
+    for num, filename in enumerate(filenames):
+        write_file(
+            filename,
+            f"Copyright (c) 2023 NVIDIA CORPORATION\nFile {num} modified\n",
+        )
+
+    args = argparse.Namespace(
+        files=[fn(filename) for filename in filenames],
+        fix=False,
+        jobs=2,
+        main_branch=None,
+        target_branch="master",
+        find_copies_harder=True,
+    )
+    with (
+        patch("os.getcwd", Mock(return_value=git_repo.working_tree_dir)),
+        patch.dict("os.environ", {"RAPIDS_TEST_YEAR": "2024"}),
+        patch.object(
+            Linter, "print_warnings", autospec=True
+        ) as print_warnings,
+        pytest.raises(SystemExit),
+    ):
+        with ExecutionContext(args) as ctx:
+            ctx.add_check(copyright.check_copyright(ctx.args))
+
+    linters = [call.args[0] for call in print_warnings.call_args_list]
+    assert [linter.filename for linter in linters] == args.files
+    for linter in linters:
+        assert [warning.msg for warning in linter.warnings] == [
+            "copyright is out of date"
+        ]
@@ -385,7 +385,16 @@ class TestLintMain:
             call().print(),
         ]
 
-    def test_multiple_files(self, hello_world_file, hello_file):
+    @pytest.mark.parametrize(
+        ["jobs", "forks"],
+        [
+            ("1", False),
+            ("2", True),
+            ("0", True),
+        ],
+    )
+    def test_multiple_files(self, hello_world_file, hello_file, jobs, forks):
+        before_fork = Mock()
         with (
             patch(
                 "sys.argv",
@@ -393,10 +402,15 @@ class TestLintMain:
                     "check-test",
                     "--check-test",
                     "--fix",
+                    "--jobs",
+                    jobs,
                     hello_world_file.name,
                     hello_file.name,
                 ],
             ),
+            patch(
+                "os.sched_getaffinity", Mock(return_value={0, 1}), create=True
+            ),
             self.mock_console() as console,
             pytest.raises(SystemExit, match=r"^1$"),
         ):
@@ -404,7 +418,9 @@ class TestLintMain:
             m.argparser.add_argument("--check-test", action="store_true")
             m.argparser.add_argument("--check-test-note", action="store_true")
             with m.execute() as ctx:
+                ctx.add_before_fork_hook(before_fork)
                 ctx.add_check(self.the_check)
+        assert before_fork.call_count == int(forks)
         assert hello_world_file.read() == "Good bye, world!"
         assert hello_file.read() == "Good bye!"
         assert console.mock_calls == [
@@ -439,6 +455,17 @@ class TestLintMain:
             call().print(),
         ]
 
+    @pytest.mark.parametrize("jobs", ["-3", "two"])
+    def test_invalid_jobs(self, hello_world_file, jobs):
+        with (
+            patch(
+                "sys.argv",
+                ["check-test", "--jobs", jobs, hello_world_file.name],
+            ),
+            pytest.raises(SystemExit, match=r"^2$"),
+        ):
+            LintMain().execute()
+
     def test_binary_file(self, binary_file):
         mock_linter = Mock(wraps=Linter)
         with (